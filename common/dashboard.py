@@ -0,0 +1,418 @@
+# common/dashboard.py — shared E-Commerce dashboard for df_delivered
+# Pages stay thin wrappers around render(), so every page shares one cached
+# copy of the data and one set of aggregate/figure caches.
+import os
+import tempfile
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from tsdownsample import MinMaxLTTBDownsampler
+
+# Optional GPU backend for the aggregation stage (RAPIDS cuDF). Gated on a
+# usable CUDA device: with cudf installed but no GPU/driver the import or the
+# probe raises CUDA/runtime errors, not ImportError — fall back to pandas then.
+try:
+    import cudf
+    from numba import cuda  # installed with cudf
+    if not cuda.is_available():
+        cudf = None
+except Exception:
+    cudf = None
+
+# =============== DATA PREP ===============
+CSV_PATH = "df_delivered.csv"
+ARROW_PATH = "df_delivered.arrow"
+
+# Only the columns the dashboard actually uses — the rest are never paged in
+COLUMNS = [
+    'year', 'month', 'price', 'freight_value', 'customer_state',
+    'product_category_name_english', 'review_score', 'order_id',
+    'order_purchase_timestamp',
+]
+
+def convert_csv_to_arrow(csv_path=CSV_PATH, arrow_path=ARROW_PATH):
+    """One-time conversion of the raw CSV export to an uncompressed Arrow IPC file."""
+    df = pd.read_csv(csv_path, parse_dates=['order_purchase_timestamp'])
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Write to a temp file next to the target, then swap it in atomically, so a
+    # killed or concurrent conversion never leaves a truncated file at arrow_path
+    fd, tmp_path = tempfile.mkstemp(suffix='.arrow.tmp', dir=os.path.dirname(os.path.abspath(arrow_path)))
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, arrow_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def arrow_is_stale(csv_path=CSV_PATH, arrow_path=ARROW_PATH):
+    """True when the Arrow file is missing or older than the CSV it was built from."""
+    return (not os.path.exists(arrow_path)
+            or os.path.getmtime(csv_path) > os.path.getmtime(arrow_path))
+
+def format_period(period_sort):
+    """YYYYMM key → MM/YYYY label for display."""
+    return f"{period_sort % 100:02d}/{period_sort // 100}"
+
+@st.cache_resource  # shared in-memory frame, no pickling per rerun — treat as read-only
+def load_and_prepare_data():
+    # 🔁 Convert df_delivered once (again if the CSV changed), then memory-map it
+    # and keep only the needed columns
+    if arrow_is_stale():
+        convert_csv_to_arrow()
+    source = pa.memory_map(ARROW_PATH, 'r')
+    table = ipc.open_file(source).read_all().select(COLUMNS)
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+
+    # Low-cardinality strings → ordered categoricals (filters & groupbys run on int codes)
+    for c in ('customer_state', 'product_category_name_english'):
+        df[c] = df[c].astype(pd.CategoricalDtype(sorted(df[c].dropna().unique()), ordered=True))
+
+    # float32 halves the bytes every downstream sum/mean has to stream through
+    df[['price', 'freight_value']] = df[['price', 'freight_value']].astype('float32')
+
+    # Create 'revenue' = price + freight (NumPy add keeps float32)
+    df['revenue'] = df['price'].to_numpy() + df['freight_value'].to_numpy()
+
+    # Dense int32 code per order: nunique hashes ints instead of 32-char id strings
+    df['order_id_code'] = pd.factorize(df['order_id'])[0].astype('int32')
+    df = df.drop(columns='order_id')
+
+    # Integer YYYYMM period key: sorts chronologically, filters & groups without strings
+    # (states and categories already group on their categorical int codes)
+    df['period_sort'] = df['year'] * 100 + df['month']
+
+    # Sidebar option lists, pre-sorted once here instead of on every rerun
+    sidebar_options = {
+        # YYYYMM keys sort chronologically as plain ints
+        'periods': np.sort(df['period_sort'].unique()).tolist(),
+        'states': df['customer_state'].cat.categories.tolist(),
+        'categories': df['product_category_name_english'].cat.categories.tolist(),
+        # Null rows match no option, so "every option" only means "all" without them
+        'states_hasnans': df['customer_state'].hasnans,
+        'categories_hasnans': df['product_category_name_english'].hasnans,
+    }
+
+    return df, sidebar_options
+
+# =============== FILTERS ===============
+# Apply filters — memoized as row positions, so cache entries stay small
+@st.cache_data(max_entries=32)
+def compute_mask(selected_period, selected_states, selected_categories):
+    """Positions of the rows matching the sidebar selection."""
+    df, _ = load_and_prepare_data()
+    mask = np.ones(len(df), dtype=bool)
+
+    # Period filter
+    if selected_period != "All Periods":
+        mask &= (df['period_sort'] == selected_period).to_numpy()
+
+    # State & Category filters (only if selected)
+    if selected_states:
+        mask &= df['customer_state'].isin(selected_states).to_numpy()
+    if selected_categories:
+        mask &= df['product_category_name_english'].isin(selected_categories).to_numpy()
+
+    return np.flatnonzero(mask)
+
+def apply_filters(df, selected_period, selected_states, selected_categories):
+    # Nothing narrowed → keep the reference to df (no mask, no copy)
+    if selected_period == "All Periods" and not selected_states and not selected_categories:
+        return df
+    return df.take(compute_mask(selected_period, selected_states, selected_categories))
+
+# =============== AGGREGATES ===============
+# Below this many rows the host↔device copy costs more than the GPU saves.
+# df_delivered has ~110k rows (~90x below this), so with the shipped data the
+# cuDF path never runs and has not been exercised — it is for larger exports.
+GPU_MIN_ROWS = 10_000_000
+
+def groupby_agg(frame, by, spec, sort=True):
+    """groupby(by).agg(spec) as a flat pandas frame — on the GPU for cuDF input."""
+    result = frame.groupby(by, observed=True, sort=sort).agg(spec).reset_index()
+    return result.to_pandas() if cudf is not None and isinstance(result, cudf.DataFrame) else result
+
+@st.cache_data(max_entries=32)
+def compute_aggregates(filter_key):
+    """All chart groupbys for one filter selection, computed in a single pass."""
+    filtered = apply_filters(load_and_prepare_data()[0], *filter_key)
+
+    # Very large selections: hand the groupbys to cuDF when a GPU is available
+    if cudf is not None and len(filtered) >= GPU_MIN_ROWS:
+        filtered = cudf.from_pandas(filtered[[
+            'period_sort', 'customer_state',
+            'product_category_name_english', 'revenue', 'review_score', 'order_id_code',
+        ]])
+
+    # Group by the integer period key (rows come out chronological), then
+    # label the handful of result rows in MM/YYYY format
+    monthly = groupby_agg(filtered, 'period_sort', {
+        'revenue': 'sum',
+        'order_id_code': 'nunique'
+    }).rename(columns={'order_id_code': 'orders'})
+    monthly.insert(0, 'period_mm_yyyy', monthly.pop('period_sort').map(format_period))
+
+    # State & category results get re-ranked by revenue, so skip sorting the keys
+    state_sales = groupby_agg(filtered, 'customer_state', {
+        'revenue': 'sum',
+        'order_id_code': 'nunique'
+    }, sort=False).rename(columns={'order_id_code': 'orders'}).sort_values('revenue', ascending=False)
+
+    # One category groupby feeds both the Top 10 and the Rating vs Revenue charts
+    cat_agg = groupby_agg(filtered, 'product_category_name_english', {
+        'revenue': 'sum',
+        'review_score': 'mean',
+        'order_id_code': 'nunique'
+    }, sort=False).rename(columns={'order_id_code': 'orders'})
+    cat_sales = cat_agg.nlargest(10, 'revenue')
+    cat_metrics = cat_agg[cat_agg['orders'] >= 10]  # stable categories
+
+    return {
+        'monthly': monthly,
+        'state_sales': state_sales,
+        'cat_sales': cat_sales,
+        'cat_metrics': cat_metrics,
+    }
+
+# =============== FIGURES ===============
+@st.cache_data(max_entries=32)
+def build_figures(filter_key):
+    """Plotly JSON for the four main charts — rebuilt only when the filters change."""
+    aggs = compute_aggregates(filter_key)
+    monthly = aggs['monthly']
+    state_sales = aggs['state_sales']
+    cat_sales = aggs['cat_sales']
+    cat_metrics = aggs['cat_metrics']
+
+    # Chart 1: Monthly Sales & Orders
+    fig1 = go.Figure()
+    fig1.add_trace(go.Bar(
+        x=monthly['period_mm_yyyy'],
+        y=monthly['revenue'],
+        name='Revenue (R$)',
+        yaxis='y',
+        marker_color='#FF6B6B'
+    ))
+    fig1.add_trace(go.Scatter(
+        x=monthly['period_mm_yyyy'],
+        y=monthly['orders'],
+        name='Orders',
+        yaxis='y2',
+        mode='lines+markers',
+        line=dict(color='#4ECDC4', width=3)
+    ))
+    fig1.update_layout(
+        yaxis=dict(title="Revenue (R$)", side="left"),
+        yaxis2=dict(title="Orders", side="right", overlaying="y", showgrid=False),
+        xaxis_title="Period (MM/YYYY)",
+        xaxis_tickangle=-45,
+        legend=dict(x=0.01, y=0.99)
+    )
+
+    # Chart 2: Sales by State
+    fig2 = px.bar(
+        state_sales,
+        x='customer_state',
+        y='revenue',
+        color='revenue',
+        color_continuous_scale='Blues',
+        labels={'customer_state': 'State', 'revenue': 'Revenue (R$)'},
+        text='revenue'
+    )
+    fig2.update_traces(texttemplate='R$%{text:,.0f}', textposition='outside')
+    fig2.update_layout(xaxis_tickangle=-45)
+
+    # Chart 3: Top 10 Categories
+    fig3 = px.bar(
+        cat_sales,
+        x='revenue',
+        y='product_category_name_english',
+        orientation='h',
+        color='revenue',
+        color_continuous_scale='Viridis',
+        labels={'product_category_name_english': 'Category', 'revenue': 'Revenue (R$)'}
+    )
+    fig3.update_layout(yaxis={'categoryorder': 'total ascending'})
+
+    # Chart 4: Rating vs Revenue (only categories with ≥10 orders)
+    fig4 = None
+    if not cat_metrics.empty:
+        fig4 = px.scatter(
+            cat_metrics,
+            x='review_score',
+            y='revenue',
+            size='orders',
+            color='revenue',
+            hover_name='product_category_name_english',
+            size_max=60,
+            labels={
+                'review_score': 'Avg Review Score',
+                'revenue': 'Total Revenue (R$)',
+                'orders': 'Orders'
+            },
+            title="High Revenue + High Rating = 🏆 Ideal Categories",
+            render_mode='webgl'
+        )
+        fig4.add_vline(x=4.0, line_dash="dash", line_color="red", annotation_text="4.0")
+
+    return {
+        'fig1': fig1.to_json(),
+        'fig2': fig2.to_json(),
+        'fig3': fig3.to_json(),
+        'fig4': fig4.to_json() if fig4 is not None else None,
+    }
+
+# =============== SIDEBAR FILTERS ===============
+def render_sidebar(sidebar_options):
+    """Sidebar widgets → hashable filter key (period, states, categories)."""
+    st.sidebar.header("FilterWhere")
+
+    periods = sidebar_options['periods']
+
+    # ✅ SINGLE DROPDOWN (selectbox) — not multiselect
+    selected_period = st.sidebar.selectbox(
+        "Period (MM/YYYY)",
+        options=["All Periods"] + periods,  # add "All" option
+        format_func=lambda p: p if p == "All Periods" else format_period(p),
+        index=0  # default: "All Periods"
+    )
+
+    # State filter (empty = all)
+    states = sidebar_options['states']
+    selected_states = st.sidebar.multiselect("State", states, default=[])
+
+    # Category filter (empty = all)
+    categories = sidebar_options['categories']
+    selected_categories = st.sidebar.multiselect("Category", categories, default=[])
+
+    # Picking every option is the same as picking none — share the unfiltered path,
+    # unless the column has nulls (those rows would come back in)
+    if len(selected_states) == len(states) and not sidebar_options['states_hasnans']:
+        selected_states = []
+    if len(selected_categories) == len(categories) and not sidebar_options['categories_hasnans']:
+        selected_categories = []
+
+    # Sorted tuples keep the cache key stable regardless of selection order
+    filter_key = (selected_period, tuple(sorted(selected_states)), tuple(sorted(selected_categories)))
+
+    return filter_key
+
+# =============== METRICS ===============
+def render_metrics(filtered):
+    """KPI row for the filtered rows."""
+    # Calculate KPIs
+    total_revenue = filtered['revenue'].sum()
+    total_orders = len(filtered)
+    aov = total_revenue / total_orders if total_orders > 0 else 0
+    avg_rating = filtered['review_score'].mean()
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Revenue", f"R$ {total_revenue:,.0f}")
+    col2.metric("Orders", f"{total_orders:,}")
+    col3.metric("Avg Order Value", f"R$ {aov:.0f}")
+    col4.metric("Avg Rating", f"{avg_rating:.1f} ⭐")
+
+    st.markdown("---")
+
+# =============== CHARTS ===============
+# Each section is a fragment: its own interactions rerun only that block
+@st.fragment
+def render_charts(figs):
+    """The four main charts, from the cached figure JSON."""
+    # =============== CHART 1: Monthly Sales & Orders ===============
+    st.subheader("📈 Monthly Sales & Orders")
+    st.plotly_chart(pio.from_json(figs['fig1']), use_container_width=True)
+
+    # =============== CHART 2: Sales by State ===============
+    st.subheader("📍 Sales by State")
+    st.plotly_chart(pio.from_json(figs['fig2']), use_container_width=True)
+
+    # =============== CHART 3: Top 10 Categories ===============
+    st.subheader("📦 Top 10 Categories by Revenue")
+    st.plotly_chart(pio.from_json(figs['fig3']), use_container_width=True)
+
+    # =============== CHART 4: Rating vs Revenue ===============
+    st.subheader("⭐ Avg Rating vs Revenue by Category")
+
+    if figs['fig4'] is not None:
+        st.plotly_chart(pio.from_json(figs['fig4']), use_container_width=True)
+    else:
+        st.info("No category has ≥10 orders with current filters.")
+
+# =============== BONUS: Freight Analysis ===============
+@st.fragment
+def render_freight(filtered):
+    """Freight Cost Insights expander for the filtered rows."""
+    with st.expander("📦 Freight Cost Insights"):
+        st.write("Freight as % of product price — key for margin analysis")
+    
+        # Avoid division by zero
+        filtered_safe = filtered[filtered['price'] > 0].copy()
+        filtered_safe['freight_ratio'] = filtered_safe['freight_value'].to_numpy() / filtered_safe['price'].to_numpy()
+    
+        if not filtered_safe.empty:
+            # Downsample with MinMaxLTTB (keeps shape & outliers); LTTB needs x sorted
+            df_sorted = filtered_safe.sort_values('price')
+            idx = MinMaxLTTBDownsampler().downsample(
+                df_sorted['price'].to_numpy(),
+                df_sorted['freight_value'].to_numpy(),
+                n_out=2000
+            )
+            df_sample = df_sorted.iloc[idx]
+        
+            fig5 = px.scatter(
+                df_sample,
+                x='price',
+                y='freight_value',
+                color='freight_ratio',
+                size='revenue',
+                hover_data=['product_category_name_english'],
+                labels={'price': 'Product Price (R$)', 'freight_value': 'Freight (R$)'},
+                color_continuous_scale='RdYlBu_r',
+                title="Freight vs Product Price",
+                render_mode='webgl'  # Scattergl: points drawn on the GPU, not as SVG
+            )
+            st.plotly_chart(fig5, use_container_width=True)
+        
+            avg_freight_ratio = filtered_safe['freight_ratio'].mean()
+            st.metric(
+                "Avg Freight Ratio",
+                f"{avg_freight_ratio:.1%}",
+                help="Average freight cost as % of product price"
+            )
+        else:
+            st.warning("No products with price > 0 to analyze.")
+
+# =============== PAGE ===============
+def render(page_title="🛒 E-Commerce Dashboard",
+           title="🛒 E-Commerce Performance Dashboard",
+           subtitle="Insights from delivered orders — Olist Brazil"):
+    """Render the full dashboard page."""
+    # Must be the first Streamlit command of the run
+    st.set_page_config(page_title=page_title, layout="wide")
+
+    df, sidebar_options = load_and_prepare_data()
+    filter_key = render_sidebar(sidebar_options)
+    filtered = apply_filters(df, *filter_key)
+
+    # Handle empty
+    if filtered.empty:
+        st.warning("No data matches the current filters.")
+        st.stop()
+
+    figs = build_figures(filter_key)
+
+    st.title(title)
+    st.markdown(subtitle)
+
+    render_metrics(filtered)
+    render_charts(figs)
+    render_freight(filtered)